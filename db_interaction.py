@@ -37,21 +37,26 @@ Please note that this module requires the following external libraries:
 
 For more information, refer to the README file.
 """
-import calendar
+import atexit
 import csv
+import functools
+import hashlib
+import hmac
+import itertools
 import logging
 import os
 import sqlite3
 import subprocess
-from datetime import date
+import sys
+from datetime import date, timedelta
 from pathlib import Path
+from types import MappingProxyType
+from typing import NamedTuple
 
-import pandas as pd
-from dateutil.relativedelta import relativedelta
 
 # setting up logging configurations and handlers
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
+logger.setLevel(logging.ERROR)
 
 log_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
 
@@ -68,8 +73,8 @@ LINE_SEPARATOR = "-" * 80
 MAIN_FOLDER_ROOT = Path(__file__).parent
 LOCALITY_LIST_FILE = MAIN_FOLDER_ROOT / "resources" / "lista_localitati.csv"
 
-# Dictionary that maps Romanian counties to their corresponding abbreviations
-RO_COUNTIES_ABBR = {
+# Read-only mapping of Romanian counties to their corresponding abbreviations
+RO_COUNTIES_ABBR = MappingProxyType({
     "Alba": "AB", "Arad": "AR", "Arges": "AG", "Bacau": "BC", "Bihor": "BH",
     "Bistrita-Nasaud": "BN", "Botosani": "BT", "Brasov": "BV", "Braila": "BR",
     "Buzau": "BZ", "Caras-Severin": "CS", "Calarasi": "CL", "Cluj": "CJ",
@@ -80,7 +85,16 @@ RO_COUNTIES_ABBR = {
     "Olt": "OT", "Prahova": "PH", "Satu Mare": "SM", "Salaj": "SJ",
     "Sibiu": "SB", "Suceava": "SV", "Teleorman": "TR", "Timis": "TM",
     "Tulcea": "TL", "Vaslui": "VS", "Valcea": "VL", "Vrancea": "VN"
-}
+})
+
+# Formatter bound once for the two-decimal amounts shown in the
+# consumption table
+_format_amount = "{:.2f}".format
+
+# Tuple that stores the Romanian month names, indexed by month - 1
+RO_MONTH_NAMES = (
+    "Ianuarie", "Februarie", "Martie", "Aprilie", "Mai", "Iunie", "Iulie",
+    "August", "Septembrie", "Octombrie", "Noiembrie", "Decembrie")
 
 # Dictionary that stores the prices and current TVA value
 PRICE_PER_UNIT = {
@@ -89,7 +103,85 @@ PRICE_PER_UNIT = {
 }
 TVA = 0.19
 
-# Dictionary that stores information about the detailed consumption and price
+# Unit prices unpacked once at import time; PRICE_PER_UNIT never changes
+# at runtime, so the per-call dict unpacking is not needed
+(ENERGIE_CONSUMATA_PRET, ACCIZA_NECOMERCIALA_PRET, CERTIFICATE_VERZI_PRET,
+ OUG_27_PRET) = PRICE_PER_UNIT.values()
+
+# Hot-path SQL statements, kept as module constants so every call binds
+# the identical SQL text and hits the sqlite3 statement cache
+AUTH_SQL = """SELECT role, password FROM users
+                    WHERE username = ?"""
+CLIENT_INFO_SQL = "SELECT * FROM users WHERE username = ?"
+BILL_INFO_SQL = """SELECT * FROM bills
+                       WHERE username = ? AND bill_year = ?
+                       AND bill_month = ?"""
+PREVIOUS_INDEX_SQL = """SELECT index_value FROM bills
+                    WHERE username = ? AND bill_year = ? AND bill_month = ?
+                    ORDER BY bill_year DESC, bill_month DESC LIMIT 1"""
+
+# Process-wide connection shared by all database functions, created lazily
+# by open_database and closed automatically at interpreter exit
+_CONNECTION = None
+
+def _close_database():
+    """
+    Closes the process-wide connection at interpreter exit, if open.
+    """
+    global _CONNECTION
+    if _CONNECTION is not None:
+        _CONNECTION.close()
+        _CONNECTION = None
+
+def open_database(db_file) -> sqlite3.Connection:
+    """
+    Opens the SQLite database and tunes it for this workload.
+
+    The connection is created once per process and reused on subsequent
+    calls: SQLite's page cache is per-connection, so reopening on every
+    operation throws the hot cache away. The first open switches the
+    database to WAL journaling with relaxed synchronous mode, an
+    in-memory temp store and a larger page cache. This avoids the
+    rollback-journal double write and a full fsync on every commit. The
+    connection is closed automatically at interpreter exit.
+
+    Args:
+        db_file: The path to the SQLite database file.
+
+    Returns:
+        sqlite3.Connection: The configured connection object.
+
+    Raises:
+        sqlite3.Error: If the database cannot be opened or configured.
+    """
+    global _CONNECTION
+    if _CONNECTION is None:
+        logger.info("Opening database: %s", db_file)
+        _CONNECTION = sqlite3.connect(db_file, check_same_thread=False,
+                                      cached_statements=256)
+        _CONNECTION.row_factory = sqlite3.Row
+        _CONNECTION.executescript(
+            """PRAGMA journal_mode=WAL;
+            PRAGMA synchronous=NORMAL;
+            PRAGMA temp_store=MEMORY;
+            PRAGMA cache_size=-64000;
+            PRAGMA mmap_size=268435456;
+            PRAGMA busy_timeout=5000;""")
+        _CONNECTION.execute(
+            """CREATE INDEX IF NOT EXISTS idx_bills_user_ym
+            ON bills(username, bill_year, bill_month)""")
+        _CONNECTION.execute(
+            """CREATE INDEX IF NOT EXISTS idx_bills_user_billid
+            ON bills(username, bill_id)""")
+        _CONNECTION.execute(
+            """CREATE UNIQUE INDEX IF NOT EXISTS idx_users_username
+            ON users(username)""")
+        _CONNECTION.commit()
+        atexit.register(_close_database)
+    return _CONNECTION
+
+# Template for the detailed consumption table; the per-bill columns are
+# filled into a fresh copy by create_consumption_table
 CONSUMPTION_TABLE_CONTENT = {
     "Produse si servicii": [
         "Energie consumata",
@@ -103,12 +195,90 @@ CONSUMPTION_TABLE_CONTENT = {
     "Valoare TVA (19%)": []
 }
 
+def sqlite_guard(func):
+    """
+    Decorator that logs SQLite errors raised by a database function and
+    re-raises them unchanged.
+
+    Factors out the identical try/except sqlite3.Error blocks that the
+    read functions carried individually; the callers keep handling the
+    re-raised error the same way as before.
+
+    Args:
+        func: The database function to wrap.
+
+    Returns:
+        The wrapped function.
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        except sqlite3.Error:
+            logger.exception("SQLite error occurred in %s", func.__name__)
+            raise
+    return wrapper
+
+def hash_password(password: str) -> str:
+    """
+    Hashes a password with SHA-256 for storage in the users table.
+
+    Args:
+        password (str): The plaintext password to hash.
+
+    Returns:
+        str: The hexadecimal SHA-256 digest of the password.
+    """
+    return hashlib.sha256(password.encode("utf-8")).hexdigest()
+
+def _is_password_hash(stored_password: str) -> bool:
+    """
+    Tells whether a stored password value is a SHA-256 hex digest.
+
+    Args:
+        stored_password (str): The password value stored in the users table.
+
+    Returns:
+        bool: True if the value has the shape of a hex digest.
+    """
+    if len(stored_password) != 64:
+        return False
+    try:
+        int(stored_password, 16)
+    except ValueError:
+        return False
+    return True
+
+def verify_password(password: str, stored_password: str) -> bool:
+    """
+    Checks a plaintext password against the value stored in the database.
+
+    Passwords created before hashing was introduced are stored in plaintext;
+    the raw comparison only runs for those legacy rows, so the stored digest
+    of a hashed row can never be replayed as the password itself.
+
+    Args:
+        password (str): The plaintext password provided by the user.
+        stored_password (str): The password value stored in the users table.
+
+    Returns:
+        bool: True if the password matches the stored value.
+    """
+    stored_bytes = stored_password.encode("utf-8")
+    if _is_password_hash(stored_password):
+        return hmac.compare_digest(
+            hash_password(password).encode("utf-8"), stored_bytes)
+    return hmac.compare_digest(password.encode("utf-8"), stored_bytes)
+
+@sqlite_guard
 def authenticate(
         username: str, password: str,
         cursor: sqlite3.Cursor) -> tuple[bool, bool]:
     """
-    Authenticates a user based on the provided username and password by 
-    checking against a user table in a SQLite database.
+    Authenticates a user based on the provided username and password by
+    checking against a user table in a SQLite database. The lookup is done
+    by username only and the password is verified in Python against the
+    stored SHA-256 hash.
 
     Args:
     username (str): The username provided by the user.
@@ -122,52 +292,78 @@ def authenticate(
     Raises:
         sqlite3.Error: If there is an error while executing the SQL statement.
     """
-    try:
-        logger.info("Checking user credentials in the database")
-        cursor.execute("""SELECT role FROM users
-                    WHERE username = ? AND password = ?""",
-                       (username, password))
-        result = cursor.fetchone()
-        if result:
-            role = result[0]
-            if role == 'admin':
-                logger.info("User '%s' successfully authenticated as 'admin'",
-                            username)
-                return True, True
-            logger.info("User '%s' successfully authenticated", username)
-            return True, False
-        logger.warning("Authentication failed for user '%s'", username)
-        return False, False
-    except sqlite3.Error as sqerr:
-        logger.exception(
-            "An error occurred while executing the SQL statement")
-        raise sqerr
+    logger.info("Checking user credentials in the database")
+    cursor.execute(AUTH_SQL, (username,))
+    result = cursor.fetchone()
+    if result and verify_password(password, result[1]):
+        role = result[0]
+        if role == 'admin':
+            logger.info("User '%s' successfully authenticated as 'admin'",
+                        username)
+            return True, True
+        logger.info("User '%s' successfully authenticated", username)
+        return True, False
+    logger.warning("Authentication failed for user '%s'", username)
+    return False, False
+
+_LOCALITY_DATA = None
+
+def _load_localities(file_path: str):
+    """
+    Loads the locality CSV into lookup dictionaries, once per session.
+
+    Args:
+        file_path (str): The path to the CSV file.
+
+    Returns:
+        tuple: Three dictionaries - lowercase county name to its canonical
+        spelling, lowercase county name to the set of its lowercase
+        localities, and (locality, county) lowercase pair to ZIP code.
+
+    Raises:
+        FileNotFoundError: If the specified file does not exist.
+    """
+    global _LOCALITY_DATA
+    if _LOCALITY_DATA is None:
+        logger.info("Loading locality list from file '%s'", file_path)
+        counties = {}
+        localities = {}
+        zipcodes = {}
+        with open(file_path, 'r', encoding='utf-8') as file:
+            reader = csv.reader(file)
+            next(reader)
+            for locality, county, _, zipcode in reader:
+                county_key = county.lower()
+                locality_key = locality.lower()
+                counties[county_key] = county
+                localities.setdefault(county_key, set()).add(locality_key)
+                zipcodes[(locality_key, county_key)] = zipcode
+        _LOCALITY_DATA = (counties, localities, zipcodes)
+    return _LOCALITY_DATA
 
 def validate_new_user_county(file_path: str) -> str:
     """
-    Checks if a location exists in the specified CSV file.
+    Checks if a county exists in the locality list.
 
     Args:
         file_path (str): The path to the CSV file.
 
     Returns:
-        str: The county name.
+        str: The county name, as spelled in the locality list.
 
     Raises:
         FileNotFoundError: If the specified file does not exist.
-        ValueError: If the searched value does not exist.
     """
+    counties = _load_localities(file_path)[0]
     while True:
         county = input("Introdu judetul: ")
         logger.info("Checking if county '%s' exists in file '%s'",
                     county, file_path)
-        with open(file_path, 'r', encoding='utf-8') as file:
-            reader = csv.reader(file)
-            for row in reader:
-                if county.lower() in row[1].lower():
-                    logger.info("Location '%s' found in file '%s'",
-                                county, file_path)
-                    return county
+        canonical = counties.get(county.lower())
+        if canonical is not None:
+            logger.info("Location '%s' found in file '%s'",
+                        canonical, file_path)
+            return canonical
         logger.info("Location '%s' not found in file '%s'", county, file_path)
         print("Judetul specificat nu exista!")
 
@@ -184,27 +380,24 @@ def validate_new_user_locality(county: str, file_path: str) -> str:
 
     Raises:
         FileNotFoundError: If the specified file does not exist.
-        ValueError: If the searched value does not exist.
     """
+    county_localities = _load_localities(file_path)[1].get(
+        county.lower(), frozenset())
     while True:
         locality = input("Introdu localitatea: ")
         logger.info(
             "Checking if locality '%s' exists in county '%s'", locality, county)
-        with open(file_path, 'r', encoding='utf-8') as file:
-            reader = csv.reader(file)
-            for row in reader:
-                if (row[0].lower() == locality.lower() and
-                    row[1].lower() == county.lower()):
-                    logger.info("Locality '%s' belongs to county '%s'",
-                                locality, county)
-                    return locality
+        if locality.lower() in county_localities:
+            logger.info("Locality '%s' belongs to county '%s'",
+                        locality, county)
+            return locality
         logger.info("Locality '%s' does not belong to county '%s' in file '%s'",
                     locality, county, file_path)
         print(f"Localitatea specificata nu apartine de judetul {county}!")
 
 def get_new_user_zipcode(locality, county, file_path) -> str:
     """
-    Returns the ZIP code for a given locality in a given county from a CSV file.
+    Returns the ZIP code for a given locality in a given county.
 
     Args:
         locality (str): The name of the locality.
@@ -216,17 +409,14 @@ def get_new_user_zipcode(locality, county, file_path) -> str:
 
     Raises:
         FileNotFoundError: If the specified file does not exist.
-        ValueError: If the searched value does not exist.    
     """
     logger.info("Retrieving ZIP code for locality '%s'", locality)
-    with open(file_path, 'r', encoding='utf-8') as file:
-        reader = csv.reader(file)
-        for row in reader:
-            if (row[0].lower() == locality.lower() and
-                row[1].lower() == county.lower()):
-                logger.info("ZIP code '%s' retrieved for locality '%s'",
-                            row[3], locality)
-                return row[3]
+    zipcode = _load_localities(file_path)[2].get(
+        (locality.lower(), county.lower()))
+    if zipcode is not None:
+        logger.info("ZIP code '%s' retrieved for locality '%s'",
+                    zipcode, locality)
+        return zipcode
     logger.error("No ZIP code found for locality '%s'", locality)
     print("Codul postal nu a putut fi atribuit!")
 
@@ -267,6 +457,87 @@ def validate_new_user_role():
         logger.info("Invalid user role entered: %s", role)
         print("Rolul ales poate fi doar 'user' sau 'admin!'")
 
+USER_INSERT_SQL = '''INSERT INTO users
+    (name, street, zipcode, city, county, username, password, role)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)'''
+
+# executemany cannot run statements with RETURNING, so the bulk path
+# keeps the plain INSERT above.
+USER_INSERT_RETURNING_SQL = USER_INSERT_SQL + " RETURNING id"
+
+@sqlite_guard
+def insert_user(
+        connection: sqlite3.Connection, cursor: sqlite3.Cursor, name: str,
+        street: str, zipcode: str, city: str, county: str, username: str,
+        password: str, role: str) -> int:
+    """
+    Inserts a user row into the users table.
+
+    Takes all fields as parameters so it can be driven by the interactive
+    menu or called directly from scripts; the password is hashed before
+    being stored.
+
+    Args:
+        connection (sqlite3.Connection): A connection object.
+        cursor (sqlite3.Cursor): A cursor object for executing SQL statements.
+        name (str): The full name of the client.
+        street (str): The street address of the client.
+        zipcode (str): The zip code of the client address.
+        city (str): The locality of the client address.
+        county (str): The county of the client address.
+        username (str): The username of the new user.
+        password (str): The plaintext password to hash and store.
+        role (str): The role of the new user (user/admin).
+
+    Returns:
+        int: The id assigned to the new user.
+
+    Raises:
+        sqlite3.Error: If an error occurs when SQL statement is executed.
+    """
+    logger.info("Executing SQL statement to add new user to the database")
+    cursor.execute(
+        USER_INSERT_RETURNING_SQL,
+        (name, street, zipcode, city, county, username,
+         hash_password(password), role))
+    user_id = cursor.fetchone()[0]
+    connection.commit()
+    _invalidate_client_cache(username)
+    return user_id
+
+@sqlite_guard
+def add_new_users_bulk(
+        connection: sqlite3.Connection, cursor: sqlite3.Cursor,
+        users: list) -> int:
+    """
+    Inserts several users in a single transaction.
+
+    Args:
+        connection (sqlite3.Connection): A connection object.
+        cursor (sqlite3.Cursor): A cursor object for executing SQL statements.
+        users (list): Tuples of (name, street, zipcode, city, county,
+            username, password, role), passwords in plaintext.
+
+    Returns:
+        int: The number of users inserted.
+
+    Raises:
+        sqlite3.Error: If an error occurs when SQL statement is executed.
+    """
+    rows = [(name, street, zipcode, city, county, username,
+             hash_password(password), role)
+            for (name, street, zipcode, city, county,
+                 username, password, role) in users]
+    try:
+        cursor.executemany(USER_INSERT_SQL, rows)
+        connection.commit()
+    except sqlite3.Error:
+        connection.rollback()
+        raise
+    _invalidate_client_cache()
+    logger.info("Inserted %s users in one transaction", len(rows))
+    return len(rows)
+
 def add_new_user(connection: sqlite3.Connection, cursor: sqlite3.Cursor):
     """
     Adds a new user to the database based on the provided information.
@@ -285,20 +556,14 @@ def add_new_user(connection: sqlite3.Connection, cursor: sqlite3.Cursor):
         locality = validate_new_user_locality(county, LOCALITY_LIST_FILE)
         street = input("Introdu adresa (strada, nr, bloc, apartament): ")
         zipcode = get_new_user_zipcode(locality, county, LOCALITY_LIST_FILE)
-        username = "".join([s.lower() for s in formatted_name.split()])
+        username = formatted_name.replace(" ", "").lower()
         password = username
         role = validate_new_user_role()
-
-        logger.info("Executing SQL statement to add new user to the database")
-        cursor.execute(
-            '''INSERT INTO users
-            (name, street, zipcode, city, county, username, password, role)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)''',
-            (formatted_name, street, zipcode, locality, county, username,
-             password, role))
-        connection.commit()
+        user_id = insert_user(connection, cursor, formatted_name, street,
+                              zipcode, locality, county, username, password,
+                              role)
         print(LINE_SEPARATOR)
-        print("Noul client a fost adaugat cu succes!")
+        print(f"Noul client a fost adaugat cu succes (id client: {user_id})!")
         print(f"Date autentificare: username: {username}, parola: {password}.")
         logger.info("New user added successfully")
     except sqlite3.Error as sqerr:
@@ -361,6 +626,7 @@ def modify_user_address(connection: sqlite3.Connection, cursor: sqlite3.Cursor):
                        WHERE username = ?''',
                        (street, zipcode, locality, county, username))
         connection.commit()
+        _invalidate_client_cache(username)
         logger.info("User address updated successfully.")
         print(LINE_SEPARATOR)
         print("Informatiile au fost actualizate cu succes!")
@@ -400,12 +666,15 @@ def delete_user(connection: sqlite3.Connection, cursor: sqlite3.Cursor):
                 break
             elif confirmation.lower() == "y":
                 cursor.execute('''DELETE FROM users
-                            WHERE username = ?''',
+                            WHERE username = ? RETURNING username''',
                                 (username,))
+                if cursor.fetchone() is None:
+                    raise LookupError(
+                        f'Nu exista niciun client "{username}"!')
                 print(LINE_SEPARATOR)
                 print("Clientul a fost sters cu succes!")
                 connection.commit()
-                connection.close()
+                _invalidate_client_cache(username)
                 break
             print(LINE_SEPARATOR)
             print("""Alegere invalida! Alege 'y' sau 'n'.""")
@@ -413,10 +682,29 @@ def delete_user(connection: sqlite3.Connection, cursor: sqlite3.Cursor):
             break
     logger.info("Deletion process completed.")
 
+_CLIENT_INFO_CACHE = {}
+
+def _invalidate_client_cache(username: str = None):
+    """
+    Drops cached client information after a write to the users table.
+
+    Args:
+        username (str): The username to evict, or None to clear the cache.
+    """
+    if username is None:
+        _CLIENT_INFO_CACHE.clear()
+    else:
+        _CLIENT_INFO_CACHE.pop(username, None)
+
+@sqlite_guard
 def get_client_info(username: str, cursor: sqlite3.Cursor) -> dict:
     """
     Get client information from the database based on the provided username.
 
+    Client data rarely changes during a session, so results are kept in a
+    module-level cache keyed by username; functions that modify the users
+    table evict the affected entry.
+
     Args:
         username (str): The username of the client.
         cursor (sqlite3.Cursor): A cursor object for executing SQL statements.
@@ -428,28 +716,52 @@ def get_client_info(username: str, cursor: sqlite3.Cursor) -> dict:
         sqlite3.Error: If there is an error during the execution of the SQL.
         TypeError: If there is no valid data extracted from database.
     """
+    cached = _CLIENT_INFO_CACHE.get(username)
+    if cached is not None:
+        return dict(cached)
+    logger.info("Getting client information for username: %s", username)
+    cursor.execute(CLIENT_INFO_SQL, (username,))
+    row = cursor.fetchone()
     try:
-        logger.info("Getting client information for username: %s", username)
-        cursor.execute("SELECT * FROM users WHERE username = ?", (username,))
-        row = cursor.fetchone()
-        try:
-            columns = [desc[0] for desc in cursor.description]
-            user_dict = dict(zip(columns, row))
-            logger.info("Client info retrieved for username: %s", username)
-            return user_dict
-        except TypeError as terr:
-            logger.exception("No client found with username: %s", username)
-            raise terr
-    except sqlite3.Error as sqerr:
-        logger.exception("SQLite error occurred: %s", str(sqerr))
-        raise sqerr
+        user_dict = dict(row)
+        user_dict["county_abbr"] = RO_COUNTIES_ABBR[user_dict["county"]]
+        logger.info("Client info retrieved for username: %s", username)
+        _CLIENT_INFO_CACHE[username] = user_dict
+        return dict(user_dict)
+    except TypeError as terr:
+        logger.exception("No client found with username: %s", username)
+        raise terr
+
+_BILL_INFO_CACHE = {}
 
+def _invalidate_bill_cache(username: str, bill_year: int = None,
+                           bill_month: int = None):
+    """
+    Drops cached bill information after a write to the bills table.
+
+    Args:
+        username (str): The username whose bills changed.
+        bill_year (int): The year of the changed bill, or None to evict
+            every cached bill of the user.
+        bill_month (int): The month of the changed bill.
+    """
+    if bill_year is None:
+        for key in [k for k in _BILL_INFO_CACHE if k[0] == username]:
+            del _BILL_INFO_CACHE[key]
+    else:
+        _BILL_INFO_CACHE.pop((username, bill_year, bill_month), None)
+
+@sqlite_guard
 def get_bill_info(
         username: str, bill_year: int, bill_month: int,
         cursor: sqlite3.Cursor) -> dict:
     """
     Get bill information from the database for a specific month.
 
+    Bills are read several times while building the PDF and the consumption
+    table, so rows are cached per (username, year, month); the functions
+    that write bills evict the affected entries.
+
     Args:
         username (str): The username associated with the bill.
         bill_year (int): The year of the bill.
@@ -463,29 +775,25 @@ def get_bill_info(
         sqlite3.Error: If an error occurs during the execution of the SQL code.
         TypeError: If there is no valid data extracted from database.
     """
+    cached = _BILL_INFO_CACHE.get((username, bill_year, bill_month))
+    if cached is not None:
+        return dict(cached)
     logger.info("Getting bill info for username: %s, year: %s, month: %s",
                 username, bill_year, bill_month)
+    cursor.execute(BILL_INFO_SQL, (username, bill_year, bill_month))
+    row = cursor.fetchone()
     try:
-        cursor.execute("""SELECT * FROM bills
-                       WHERE username = ? AND bill_year = ?
-                       AND bill_month = ?""",
-                       (username, bill_year, bill_month))
-        row = cursor.fetchone()
-        try:
-            columns = [desc[0] for desc in cursor.description]
-            bill_info_dict = dict(zip(columns, row))
-            logger.info("Bill info retrieved for user: %s, year: %s, month: %s",
-                        username, bill_year, bill_month)
-            return bill_info_dict
-        except TypeError as terr:
-            month_name = get_romanian_month_name(bill_month)
-            logger.error("No bill found for username: %s, year: %s, month: %s",
-                         username, bill_year, bill_month)
-            raise TypeError(f"Nu exista nicio factura pentru luna "
-                            f"{month_name} {bill_year}!") from terr
-    except sqlite3.Error as sqerr:
-        logger.error("SQLite error occurred: %s", str(sqerr))
-        raise sqerr
+        bill_info_dict = dict(row)
+        logger.info("Bill info retrieved for user: %s, year: %s, month: %s",
+                    username, bill_year, bill_month)
+        _BILL_INFO_CACHE[(username, bill_year, bill_month)] = bill_info_dict
+        return dict(bill_info_dict)
+    except TypeError as terr:
+        month_name = get_romanian_month_name(bill_month)
+        logger.error("No bill found for username: %s, year: %s, month: %s",
+                     username, bill_year, bill_month)
+        raise TypeError(f"Nu exista nicio factura pentru luna "
+                        f"{month_name} {bill_year}!") from terr
 
 def create_consumption_table(
         username: str, bill_year: int, bill_month: int,
@@ -510,34 +818,23 @@ def create_consumption_table(
                     %s, year: %s, month: %s""",
                     username, bill_year, bill_month)
         cons_dict = get_bill_info(username, bill_year, bill_month, cursor)
-        CONSUMPTION_TABLE_CONTENT["Cantitate"] = [
-            f"{cons_dict['energ_cons_cant']:.2f}",
-            f"{cons_dict['acciza_cant']:.2f}",
-            f"{cons_dict['certif_cant']:.2f}",
-            f"{cons_dict['oug_cant']:.2f}",
-        ]
-        CONSUMPTION_TABLE_CONTENT["Pret unitar fara TVA"] = [
-            f"{PRICE_PER_UNIT['energie_consumata']:.2f}",
-            f"{PRICE_PER_UNIT['acciza_necomerciala']:.2f}",
-            f"{PRICE_PER_UNIT['certificate_verzi']:.2f}",
-            f"{PRICE_PER_UNIT['oug_27']:.2f}"
-        ]
-        CONSUMPTION_TABLE_CONTENT["Valoare fara TVA"] = [
-            f"{cons_dict['energ_cons_val']:.2f}",
-            f"{cons_dict['acciza_val']:.2f}",
-            f"{cons_dict['certif_val']:.2f}",
-            f"{cons_dict['oug_val']:.2f}",
-        ]
-        CONSUMPTION_TABLE_CONTENT["Valoare TVA (19%)"] = [
-            f"{cons_dict['energ_cons_tva']:.2f}",
-            f"{cons_dict['acciza_tva']:.2f}",
-            f"{cons_dict['certif_tva']:.2f}",
-            f"{cons_dict['oug_tva']:.2f}",
-        ]
-        logger.info("""Consumption table created for user: 
+        consumption_table = dict(CONSUMPTION_TABLE_CONTENT)
+        consumption_table["Cantitate"] = list(map(_format_amount, (
+            cons_dict['energ_cons_cant'], cons_dict['acciza_cant'],
+            cons_dict['certif_cant'], cons_dict['oug_cant'])))
+        consumption_table["Pret unitar fara TVA"] = list(map(_format_amount, (
+            ENERGIE_CONSUMATA_PRET, ACCIZA_NECOMERCIALA_PRET,
+            CERTIFICATE_VERZI_PRET, OUG_27_PRET)))
+        consumption_table["Valoare fara TVA"] = list(map(_format_amount, (
+            cons_dict['energ_cons_val'], cons_dict['acciza_val'],
+            cons_dict['certif_val'], cons_dict['oug_val'])))
+        consumption_table["Valoare TVA (19%)"] = list(map(_format_amount, (
+            cons_dict['energ_cons_tva'], cons_dict['acciza_tva'],
+            cons_dict['certif_tva'], cons_dict['oug_tva'])))
+        logger.info("""Consumption table created for user:
                     %s, year: %s, month: %s""",
                     username, bill_year, bill_month)
-        return CONSUMPTION_TABLE_CONTENT
+        return consumption_table
     except sqlite3.Error as sqerr:
         print(f"Eroare la conectarea la baza de date: {sqerr}")
         logger.exception("""SQLite error occurred while creating consumption
@@ -563,17 +860,42 @@ def get_romanian_month_name(bill_month: int) -> str:
         ValueError: If the provided month is out of range.
     """
     logger.info("Retrieving Romanian month name for month: %s", bill_month)
-    romanian_month_names = [
-        "Ianuarie", "Februarie", "Martie", "Aprilie", "Mai", "Iunie", "Iulie",
-        "August", "Septembrie", "Octombrie", "Noiembrie", "Decembrie"]
     try:
-        romanian_month_name = romanian_month_names[bill_month - 1]
+        romanian_month_name = RO_MONTH_NAMES[bill_month - 1]
         logger.info("Romanian month name retrieved: %s", romanian_month_name)
         return romanian_month_name
     except IndexError as ierr:
         logger.exception(ierr)
         raise IndexError("Month must be between 1 and 12.") from ierr
 
+@sqlite_guard
+def get_previous_index(cursor: sqlite3.Cursor, username: str, bill_year: int,
+                       bill_month: int) -> float:
+    """
+    Fetches the index recorded in the month before the given one.
+
+    Args:
+        cursor: The SQLite cursor object.
+        username (str): The username of the user.
+        bill_year (int): The year of the bill.
+        bill_month (int): The month of the bill.
+
+    Returns:
+        float: The previous index value, or 0.0 if no earlier record
+        exists (so the first consumption equals the index itself).
+
+    Raises:
+        sqlite3.Error: If there is an error executing the SQL query.
+    """
+    if bill_month == 1:
+        cursor.execute(PREVIOUS_INDEX_SQL, (username, bill_year - 1, 12))
+    else:
+        cursor.execute(PREVIOUS_INDEX_SQL,
+                       (username, bill_year, bill_month - 1))
+    previous_entry = cursor.fetchone()
+    return previous_entry[0] if previous_entry else 0.0
+
+@sqlite_guard
 def calculate_monthly_consumption(
         cursor: sqlite3.Cursor, username: str, bill_year: int, bill_month: int,
         index_value: float) -> float:
@@ -594,38 +916,28 @@ def calculate_monthly_consumption(
         sqlite3.Error: If there is an error executing the SQL query.
         ValueError: If the provided bill month or year is out of range.
     """
-    logger.info("""Calculating monthly consumption for username: 
+    logger.info("""Calculating monthly consumption for username:
                 %s, year: %s, month: %s, index value: %s""",
                 username, bill_year, bill_month, index_value)
-    sql_statement = """SELECT index_value FROM bills
-                    WHERE username = ? AND bill_year = ? AND bill_month = ?
-                    ORDER BY bill_year DESC, bill_month DESC LIMIT 1"""
     try:
-        if bill_month == 1:
-            cursor.execute(sql_statement, (username, bill_year - 1, 12))
-        else:
-            cursor.execute(sql_statement, (username, bill_year, bill_month - 1))
-        previous_entry = cursor.fetchone()
-        if previous_entry:
-            previous_index = previous_entry[0]
-            monthly_consumption = index_value - previous_index
-        else:
-            monthly_consumption = index_value
+        previous_index = get_previous_index(
+            cursor, username, bill_year, bill_month)
+        monthly_consumption = index_value - previous_index
         logger.info("Monthly consumption calculated: %s", monthly_consumption)
         return monthly_consumption
-    except sqlite3.Error as sqerr:
-        print(f"SQLite error occurred while opening database: {sqerr}")
-        logger.error("SQLite error occurred while opening database: %s", sqerr)
-        raise sqerr
     except ValueError as verr:
         logger.error("Invalid bill month or year: %s", str(verr))
         raise ValueError(f"An sau luna invalida: {verr}") from verr
 
+@functools.lru_cache(maxsize=128)
 def calculate_bill_period(bill_year: int, bill_month: int) -> date:
     """
     Calculates the start and end date of the billing period and also the
     generation date and due date of the bill.
 
+    The function is pure, so results are memoized; the same few periods
+    are requested for every client processed in a run.
+
     Args:
         bill_year (int): The year of the bill.
         bill_month (int): The month of the bill.
@@ -641,14 +953,12 @@ def calculate_bill_period(bill_year: int, bill_month: int) -> date:
                 bill_year, bill_month)
     try:
         bill_start_date = date(bill_year, bill_month, 1)
-        last_day = calendar.monthrange(year=bill_year, month=bill_month)[1]
-        bill_end_date = date(bill_year, bill_month, last_day)
-        next_month = bill_month + 1
-        if next_month > 12:
-            next_month = 1
-            bill_year += 1
-        bill_generated_date = date(bill_year, next_month, 1)
-        bill_due_date = bill_generated_date + relativedelta(months=1)
+        next_year = bill_year + bill_month // 12
+        next_month = bill_month % 12 + 1
+        bill_generated_date = date(next_year, next_month, 1)
+        bill_end_date = bill_generated_date - timedelta(days=1)
+        bill_due_date = date(next_year + next_month // 12,
+                             next_month % 12 + 1, 1)
         logger.info("""Bill period calculated: Start Date: 
                     %s, End Date: %s, Generated Date: %s, Due Date: %s""",
                     bill_start_date, bill_end_date, bill_generated_date,
@@ -683,11 +993,9 @@ def calculate_cons(cursor: sqlite3.Cursor, username: str, bill_year: int,
     try:
         energ_cons_cant = calculate_monthly_consumption(
             cursor, username, bill_year, bill_month, index_value)
-        acciza_cant = calculate_monthly_consumption(
-            cursor, username, bill_year, bill_month, index_value) / 1000
+        acciza_cant = energ_cons_cant / 1000
         certif_cant = acciza_cant
-        oug_cant = - calculate_monthly_consumption(
-            cursor, username, bill_year, bill_month, index_value)
+        oug_cant = - energ_cons_cant
         logger.info("""Consumption values calculated: 
                     Energy: %s, Acciza: %s, Certif: %s, OUG: %s""",
                     energ_cons_cant, acciza_cant, certif_cant, oug_cant)
@@ -696,8 +1004,44 @@ def calculate_cons(cursor: sqlite3.Cursor, username: str, bill_year: int,
         logger.error("Invalid data: %s", str(verr))
         raise ValueError(f"Date invalide la calculul consumului: {verr}") from verr
 
+def calculate_price_components(
+        energ_cons_cant: float, acciza_cant: float, certif_cant: float,
+        oug_cant: float) -> tuple:
+    """
+    Computes the per-component values, TVA amounts and totals for a bill.
+
+    This is the pure arithmetic core of the price calculation: it takes the
+    four consumption quantities and touches neither the database nor any
+    user interaction, so bulk jobs (e.g. re-pricing past bills after a
+    tariff change) can run it directly over plain floats.
+
+    Args:
+        energ_cons_cant (float): The consumed energy quantity (kWh).
+        acciza_cant (float): The non-commercial excise quantity (MWh).
+        certif_cant (float): The green certificates quantity (MWh).
+        oug_cant (float): The OUG 27 compensation quantity (kWh).
+
+    Returns:
+        tuple: A tuple containing the calculated prices and total bill value.
+    """
+    energ_cons_val = energ_cons_cant * ENERGIE_CONSUMATA_PRET
+    energ_cons_tva = energ_cons_val * TVA
+    acciza_val = acciza_cant * ACCIZA_NECOMERCIALA_PRET
+    acciza_tva = acciza_val * TVA
+    certif_val = certif_cant * CERTIFICATE_VERZI_PRET
+    certif_tva = certif_val * TVA
+    oug_val = oug_cant * OUG_27_PRET
+    oug_tva = oug_val * TVA
+    total_fara_tva = energ_cons_val + acciza_val + certif_val + oug_val
+    total_tva = energ_cons_tva + acciza_tva + certif_tva + oug_tva
+    total_bill_value = total_fara_tva + total_tva
+    return (energ_cons_val, energ_cons_tva, acciza_val, acciza_tva,
+            certif_val, certif_tva, oug_val, oug_tva, total_fara_tva,
+            total_tva, total_bill_value)
+
 def calculate_prices(cursor: sqlite3.Cursor, username: str, bill_year: int,
-                     bill_month: int, index_value: float) -> tuple:
+                     bill_month: int, index_value: float,
+                     cons: tuple = None) -> tuple:
     """
     Calculates the prices for each consumption parameter and total bill value.
 
@@ -707,6 +1051,9 @@ def calculate_prices(cursor: sqlite3.Cursor, username: str, bill_year: int,
         bill_year (int): The year of the bill.
         bill_month (int): The month of the bill.
         index_value (float): The index value for consumption calculation.
+        cons (tuple): Consumption quantities already computed by
+            calculate_cons; pass them to avoid querying the previous
+            index a second time.
 
     Returns:
         tuple: A tuple containing the calculated prices and total bill value.
@@ -715,25 +1062,18 @@ def calculate_prices(cursor: sqlite3.Cursor, username: str, bill_year: int,
         ValueError: If username, bill month, or bill year is invalid.
         TypeError: If the index_value is not a valid float value.
     """
-    logger.info("""Calculating prices for username: 
+    logger.info("""Calculating prices for username:
                 %s, bill_year: %s, bill_month: %s""",
                 username, bill_year, bill_month)
     try:
-        energ_cons_cant, acciza_cant, certif_cant, oug_cant = (
-            calculate_cons(cursor, username, bill_year, bill_month, index_value))
-        energie_consumata, acciza_necomerciala, certificate_verzi, oug_27 = (
-            PRICE_PER_UNIT.values())
-        energ_cons_val = energ_cons_cant * energie_consumata
-        energ_cons_tva = energ_cons_val * TVA
-        acciza_val = acciza_cant * acciza_necomerciala
-        acciza_tva = acciza_val * TVA
-        certif_val = certif_cant * certificate_verzi
-        certif_tva = certif_val * TVA
-        oug_val = oug_cant * oug_27
-        oug_tva = oug_val * TVA
-        total_fara_tva = energ_cons_val + acciza_val + certif_val + oug_val
-        total_tva = energ_cons_tva + acciza_tva + certif_tva + oug_tva
-        total_bill_value = total_fara_tva + total_tva
+        if cons is None:
+            cons = calculate_cons(
+                cursor, username, bill_year, bill_month, index_value)
+        energ_cons_cant, acciza_cant, certif_cant, oug_cant = cons
+        (energ_cons_val, energ_cons_tva, acciza_val, acciza_tva, certif_val,
+         certif_tva, oug_val, oug_tva, total_fara_tva, total_tva,
+         total_bill_value) = calculate_price_components(
+             energ_cons_cant, acciza_cant, certif_cant, oug_cant)
 
         logger.info("""Prices calculated: Energy Consumption Value: %s, 
                     Energy Consumption VAT: %s, Acciza Value: %s, 
@@ -782,12 +1122,10 @@ def generate_bill_input(cursor: sqlite3.Cursor, username: str) -> tuple:
         last_bill_month, last_bill_year = row[-1]
         ro_fbm = get_romanian_month_name(first_bill_month)
         ro_lbm = get_romanian_month_name(last_bill_month)
-        years_set = {tuplu[1] for tuplu in row}
-        if len(years_set) > 1:
-            years_set_unpack = (", ".join(str(bill_year) for
-                                bill_year in years_set))
-        else:
-            years_set_unpack = str(next(iter(years_set)))
+        months_by_year = {}
+        for month, year in row:
+            months_by_year.setdefault(year, set()).add(month)
+        years_set_unpack = ", ".join(str(year) for year in months_by_year)
         print(LINE_SEPARATOR)
         print(f"Poti genera facturi pentru perioada: {ro_fbm} {first_bill_year}"
               f" - {ro_lbm} {last_bill_year}")
@@ -798,27 +1136,23 @@ def generate_bill_input(cursor: sqlite3.Cursor, username: str) -> tuple:
                 print(LINE_SEPARATOR)
                 bill_year = input(
                     "Introdu anul pentru care vrei sa generezi factura: ")
-                if not bill_year.isdigit() or int(bill_year) not in years_set:
+                if (not bill_year.isdigit() or
+                        int(bill_year) not in months_by_year):
                     raise ValueError(
                         f"An invalid! Valori posibile: {years_set_unpack}.")
                 break
             except ValueError as verr:
                 logger.exception("Invalid bill year: %s", verr)
                 print(verr)
+        months_set = months_by_year[int(bill_year)]
+        months_set_unpack = ", ".join(str(month) for month in months_set)
         while True:
             try:
-                months_set = ({month for month, year in row 
-                              if year == int(bill_year)})
-                if len(months_set) > 1:
-                    months_set_unpack = (", ".join(str(month_year) for
-                                         month_year in months_set))
-                else:
-                    months_set_unpack = str(next(iter(months_set)))
                 print(LINE_SEPARATOR)
                 bill_month = input("Introdu numarul lunii pentru care vrei sa "
                                    "generezi factura PDF: ")
-                if (not bill_month.isdigit() or 
-                    (int(bill_month), int(bill_year)) not in row):
+                if (not bill_month.isdigit() or
+                        int(bill_month) not in months_set):
                     raise ValueError(
                         f"Luna invalida! Valori posibile: {months_set_unpack}")
                 break
@@ -832,6 +1166,23 @@ def generate_bill_input(cursor: sqlite3.Cursor, username: str) -> tuple:
     except sqlite3.Error as sqerr:
         print(f"Eroare la conectarea la baza de date: {sqerr}")
 
+def _ask_yes_no(prompt: str) -> bool:
+    """
+    Asks a y/n question until a valid answer is given.
+
+    Args:
+        prompt (str): The question shown to the user.
+
+    Returns:
+        bool: True for 'y', False for 'n'.
+    """
+    while True:
+        choice = input(prompt).strip().lower()
+        if choice in ("y", "n"):
+            return choice == "y"
+        print(LINE_SEPARATOR)
+        print("""Alegere invalida! Alege 'y' sau 'n'.""")
+
 def update_index_input(cursor: sqlite3.Cursor):
     """
     Prompts the admin to enter the client username and new index value for 
@@ -865,6 +1216,8 @@ def update_index_input(cursor: sqlite3.Cursor):
         print(LINE_SEPARATOR)
         print(f"Poti modifica indexul lunii {ro_month} {index_year}!")
         print(f"Indexul existent este {old_index}!")
+        previous_index = get_previous_index(
+            cursor, username, index_year, index_month)
         while True:
             try:
                 print(LINE_SEPARATOR)
@@ -872,34 +1225,21 @@ def update_index_input(cursor: sqlite3.Cursor):
                 if not new_index.isdigit():
                     raise ValueError("Indexul este o valoare numerica!")
                 new_index = float(new_index)
-                consumption = calculate_monthly_consumption(
-                    cursor, username, index_year, index_month, new_index)
+                consumption = new_index - previous_index
                 if consumption < 0:
                     raise ValueError("Consumul nu poate fi negativ!")
                 print(f"Conform acestui index, consumul pentru luna "
                       f"{ro_month} {index_year} va fi de "
                       f"{consumption} kWh.")
 
-                while True:
-                    confirmation = input(
-                        "Doresti sa continui cu acest index? (y/n) ")
-                    if confirmation.lower() == "y":
-                        logger.info("""Updated index input: Username: %s, 
-                                    Index Year: %s, Index Month: %s, 
-                                    New Index: %s""",
+                if _ask_yes_no("Doresti sa continui cu acest index? (y/n) "):
+                    logger.info("""Updated index input: Username: %s,
+                                Index Year: %s, Index Month: %s,
+                                New Index: %s""",
                                 username, index_year, index_month, new_index)
-                        print(f"Indexul a fost modificat de la {old_index} "
-                              f"la {new_index}.")
-                        break
-                    elif confirmation.lower() == "n":
-                        break
-                    else:
-                        print(LINE_SEPARATOR)
-                        print("""Alegere invalida! Alege 'y' sau 'n'.""")
-                if confirmation.lower() == "y":
+                    print(f"Indexul a fost modificat de la {old_index} "
+                          f"la {new_index}.")
                     return username, index_year, index_month, new_index
-                if confirmation.lower() == "n":
-                    continue
             except ValueError as verr:
                 logger.exception("Invalid index value: %s", verr)
                 print(LINE_SEPARATOR)
@@ -914,6 +1254,14 @@ def update_index_input(cursor: sqlite3.Cursor):
                          the database: %s""", sqerr)
         print(sqerr)
 
+BILL_UPDATE_SQL = """UPDATE bills SET index_value = ?, energ_cons_cant = ?,
+    energ_cons_pret = ?, energ_cons_val = ?, energ_cons_tva = ?,
+    acciza_cant = ?, acciza_pret = ?, acciza_val = ?, acciza_tva = ?,
+    certif_cant = ?, certif_pret = ?, certif_val = ?, certif_tva = ?,
+    oug_cant = ?, oug_pret = ?, oug_val = ?, oug_tva = ?,
+    total_fara_tva = ?, total_tva = ?, total_bill_value = ?
+    WHERE username = ? AND bill_year = ? AND bill_month = ?"""
+
 def update_index(connection: sqlite3.Connection, cursor: sqlite3.Cursor):
     """
     Updates the index value and recalculates the corresponding consumption values
@@ -932,26 +1280,21 @@ def update_index(connection: sqlite3.Connection, cursor: sqlite3.Cursor):
             cursor)
         energ_cons_cant, acciza_cant, certif_cant, oug_cant = (
             calculate_cons(cursor, username, index_year, index_month, new_index))
-        energie_consumata, acciza_necomerciala, certificate_verzi, oug_27 = (
-            PRICE_PER_UNIT.values())
         (energ_cons_val, energ_cons_tva, acciza_val, acciza_tva, certif_val,
          certif_tva, oug_val, oug_tva, total_fara_tva, total_tva,
          total_bill_value) = calculate_prices(
-            cursor, username, index_year, index_month, new_index)
+            cursor, username, index_year, index_month, new_index,
+            cons=(energ_cons_cant, acciza_cant, certif_cant, oug_cant))
         cursor.execute(
-            """ UPDATE bills SET index_value = ?, energ_cons_cant = ?,
-            energ_cons_pret = ?, energ_cons_val = ?, energ_cons_tva = ?,
-            acciza_cant = ?, acciza_pret = ?, acciza_val = ?,acciza_tva = ?,
-            certif_cant = ?, certif_pret = ?, certif_val = ?, certif_tva = ?,
-            oug_cant = ?, oug_pret = ?, oug_val = ?, oug_tva = ?,
-            total_fara_tva = ?, total_tva = ?, total_bill_value = ?
-            WHERE username = ? AND bill_year = ? AND bill_month = ?""",
-            (new_index, energ_cons_cant, energie_consumata, energ_cons_val,
-             energ_cons_tva, acciza_cant, acciza_necomerciala, acciza_val,
-             acciza_tva, certif_cant, certificate_verzi, certif_val,
-             certif_tva, oug_cant, oug_27, oug_val, oug_tva, total_fara_tva,
+            BILL_UPDATE_SQL,
+            (new_index, energ_cons_cant, ENERGIE_CONSUMATA_PRET,
+             energ_cons_val, energ_cons_tva, acciza_cant,
+             ACCIZA_NECOMERCIALA_PRET, acciza_val, acciza_tva, certif_cant,
+             CERTIFICATE_VERZI_PRET, certif_val, certif_tva, oug_cant,
+             OUG_27_PRET, oug_val, oug_tva, total_fara_tva,
              total_tva, total_bill_value, username, index_year, index_month))
         connection.commit()
+        _invalidate_bill_cache(username, index_year, index_month)
         logger.info("Index updated successfully")
     except ValueError as verr:
         logger.exception("ValueError occurred: %s", verr)
@@ -987,30 +1330,22 @@ def get_index_input(cursor: sqlite3.Cursor, username: str) -> tuple:
         if row:
             last_bill_month, last_bill_year, last_bill_index = row
             ro_last_bill_month = get_romanian_month_name(last_bill_month)
-            if last_bill_month == 12:
-                current_bill_month = 1
-                current_bill_year = last_bill_year + 1
-                print(f"Ultima luna pentru care s-a inregistrat consumul: "
-                      f"{ro_last_bill_month} {last_bill_year}")
-                print(f"Ultimul index inregistrat: {last_bill_index} kWh")
-                logger.info("Last recorded consumption month: %s %s",
-                            ro_last_bill_month, last_bill_year)
-                logger.info("Last recorded index: %s kWh", last_bill_index)
-            else:
-                current_bill_month = last_bill_month + 1
-                current_bill_year = last_bill_year
-                print(f"Ultima luna pentru care s-a inregistrat consumul: "
-                      f"{ro_last_bill_month} {last_bill_year}")
-                print(f"Ultimul index inregistrat: {last_bill_index} kWh")
-                logger.info("Last recorded consumption month: %s %s",
-                            ro_last_bill_month, last_bill_year)
-                logger.info("Last recorded index: %s kWh", last_bill_index)
+            current_bill_month = last_bill_month % 12 + 1
+            current_bill_year = last_bill_year + last_bill_month // 12
+            print(f"Ultima luna pentru care s-a inregistrat consumul: "
+                  f"{ro_last_bill_month} {last_bill_year}")
+            print(f"Ultimul index inregistrat: {last_bill_index} kWh")
+            logger.info("Last recorded consumption month: %s %s",
+                        ro_last_bill_month, last_bill_year)
+            logger.info("Last recorded index: %s kWh", last_bill_index)
         else:
             current_bill_month = 1
             current_bill_year = 2020
             print("Nu exista inregistrari anterioare ale consumului!")
             logger.info("No previous consumption records found")
         ro_current_bill_month = get_romanian_month_name(current_bill_month)
+        previous_index = get_previous_index(
+            cursor, username, current_bill_year, current_bill_month)
         while True:
             try:
                 print(LINE_SEPARATOR)
@@ -1021,28 +1356,14 @@ def get_index_input(cursor: sqlite3.Cursor, username: str) -> tuple:
                     raise ValueError(
                         "Indexul trebuie sa fie o valoare numerica!")
                 index_value = float(index_value)
-                consumption = calculate_monthly_consumption(
-                    cursor, username, current_bill_year, current_bill_month,
-                    index_value)
+                consumption = index_value - previous_index
                 if consumption < 0:
                     raise ValueError("Consumul nu poate fi negativ!")
                 print(f"Conform acestui index, consumul pentru luna "
                       f"{ro_current_bill_month} {current_bill_year} va fi de "
                       f"{consumption} kWh.")
-                while True:
-                    confirmation = input(
-                        "Doresti sa continui cu acest index? (y/n) ")
-                    if confirmation.lower() == "y":
-                        break
-                    elif confirmation.lower() == "n":
-                        break
-                    else:
-                        print(LINE_SEPARATOR)
-                        print("""Alegere invalida! Alege 'y' sau 'n'.""")
-                if confirmation.lower() == "y":
+                if _ask_yes_no("Doresti sa continui cu acest index? (y/n) "):
                     break
-                if confirmation.lower() == "n":
-                    continue
             except ValueError as verr:
                 logger.exception("ValueError occurred: %s", verr)
                 print(verr)
@@ -1054,6 +1375,107 @@ def get_index_input(cursor: sqlite3.Cursor, username: str) -> tuple:
         print(LINE_SEPARATOR)
         print(f"Eroare la conectarea la baza de date: {sqerr}")
 
+class BillRecord(NamedTuple):
+    """
+    A single row of the bills table, in the column order expected by the
+    INSERT statement used in provide_index.
+    """
+    user_id: int
+    username: str
+    bill_year: int
+    bill_month: int
+    bill_generated_date: date
+    bill_serial: str
+    bill_number: str
+    bill_due_date: date
+    bill_start_date: date
+    bill_end_date: date
+    index_value: float
+    energ_cons_cant: float
+    energ_cons_pret: float
+    energ_cons_val: float
+    energ_cons_tva: float
+    acciza_cant: float
+    acciza_pret: float
+    acciza_val: float
+    acciza_tva: float
+    certif_cant: float
+    certif_pret: float
+    certif_val: float
+    certif_tva: float
+    oug_cant: float
+    oug_pret: float
+    oug_val: float
+    oug_tva: float
+    total_fara_tva: float
+    total_tva: float
+    total_bill_value: float
+
+# INSERT statement matching the BillRecord field order, kept as a module
+# constant so every call binds the same SQL text
+BILL_INSERT_SQL = """INSERT INTO bills (
+    user_id, username, bill_year, bill_month, bill_generated_date,
+    bill_serial, bill_number, bill_due_date, bill_start_date,
+    bill_end_date, index_value, energ_cons_cant, energ_cons_pret,
+    energ_cons_val, energ_cons_tva, acciza_cant, acciza_pret,
+    acciza_val, acciza_tva, certif_cant, certif_pret, certif_val,
+    certif_tva, oug_cant, oug_pret, oug_val, oug_tva,
+    total_fara_tva, total_tva, total_bill_value)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
+    ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+
+def build_bill_record(
+        cursor: sqlite3.Cursor, username: str, bill_year: int,
+        bill_month: int, index_value: float) -> BillRecord:
+    """
+    Assembles the complete bills-table row for a new index value.
+
+    Args:
+        cursor (sqlite3.Cursor): The SQLite cursor.
+        username (str): The username associated with the index value and bill.
+        bill_year (int): The year of the bill.
+        bill_month (int): The month of the bill.
+        index_value (float): The new index value.
+
+    Returns:
+        BillRecord: The assembled row, ready to bind to the INSERT statement.
+
+    Raises:
+        ValueError: If the consumption or price calculation receives
+            invalid data.
+        sqlite3.Error: If there is an error when executing the SQL statement.
+    """
+    client_info = get_client_info(username, cursor)
+    bill_start_date, bill_end_date, bill_generated_date, bill_due_date = (
+        calculate_bill_period(bill_year, bill_month))
+    bill_no = (f"{bill_generated_date.day:02d}"
+               f"{bill_generated_date.month:02d}"
+               f"{bill_generated_date.year % 100:02d}"
+               f"{client_info['id']:06d}")
+    bill_serial = client_info["county_abbr"]
+    energ_cons_cant, acciza_cant, certif_cant, oug_cant = (
+        calculate_cons(cursor, username, bill_year, bill_month, index_value))
+    (energ_cons_val, energ_cons_tva, acciza_val, acciza_tva, certif_val,
+     certif_tva, oug_val, oug_tva, total_fara_tva, total_tva,
+     total_bill_value) = calculate_prices(
+         cursor, username, bill_year, bill_month, index_value,
+         cons=(energ_cons_cant, acciza_cant, certif_cant, oug_cant))
+    return BillRecord(
+        user_id=client_info["id"], username=client_info["username"],
+        bill_year=bill_year, bill_month=bill_month,
+        bill_generated_date=bill_generated_date, bill_serial=bill_serial,
+        bill_number=bill_no, bill_due_date=bill_due_date,
+        bill_start_date=bill_start_date, bill_end_date=bill_end_date,
+        index_value=index_value, energ_cons_cant=energ_cons_cant,
+        energ_cons_pret=ENERGIE_CONSUMATA_PRET, energ_cons_val=energ_cons_val,
+        energ_cons_tva=energ_cons_tva, acciza_cant=acciza_cant,
+        acciza_pret=ACCIZA_NECOMERCIALA_PRET, acciza_val=acciza_val,
+        acciza_tva=acciza_tva, certif_cant=certif_cant,
+        certif_pret=CERTIFICATE_VERZI_PRET, certif_val=certif_val,
+        certif_tva=certif_tva, oug_cant=oug_cant, oug_pret=OUG_27_PRET,
+        oug_val=oug_val, oug_tva=oug_tva, total_fara_tva=total_fara_tva,
+        total_tva=total_tva, total_bill_value=total_bill_value)
+
 def provide_index(
         connection: sqlite3.Connection, cursor: sqlite3.Cursor, username: str,
         bill_year: int, bill_month: int, index_value: float, ):
@@ -1076,42 +1498,12 @@ def provide_index(
                 username, bill_year, bill_month, index_value)
 
     try:
-        bill_user_id = get_client_info(username, cursor)["id"]
-        bill_user_username = get_client_info(username, cursor)["username"]
-        bill_start_date, bill_end_date, bill_generated_date, bill_due_date = (
-            calculate_bill_period(bill_year, bill_month))
-        bill_no_date = bill_generated_date.strftime('%d%m%y')
-        bill_no_id = str(get_client_info(username, cursor)["id"]).zfill(6)
-        bill_no = f"{bill_no_date}{bill_no_id}"
-        bill_serial = RO_COUNTIES_ABBR[get_client_info(username, cursor)[
-            "county"]]
-        energ_cons_cant, acciza_cant, certif_cant, oug_cant = (
-            calculate_cons(cursor, username, bill_year, bill_month, index_value))
-        (energ_cons_val, energ_cons_tva, acciza_val, acciza_tva, certif_val,
-         certif_tva, oug_val, oug_tva, total_fara_tva, total_tva,
-         total_bill_value) = calculate_prices(
-             cursor, username, bill_year, bill_month, index_value)
-        energie_consumata, acciza_necomerciala, certificate_verzi, oug_27 = (
-            PRICE_PER_UNIT.values())
+        record = build_bill_record(
+            cursor, username, bill_year, bill_month, index_value)
         ro_bill_month = get_romanian_month_name(bill_month)
-        cursor.execute("""INSERT INTO bills (
-            user_id, username, bill_year, bill_month, bill_generated_date,
-            bill_serial, bill_number, bill_due_date, bill_start_date,
-            bill_end_date, index_value, energ_cons_cant, energ_cons_pret,
-            energ_cons_val, energ_cons_tva, acciza_cant, acciza_pret,
-            acciza_val, acciza_tva, certif_cant, certif_pret, certif_val,
-            certif_tva, oug_cant, oug_pret, oug_val, oug_tva,
-            total_fara_tva, total_tva, total_bill_value)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
-            ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-            (bill_user_id, bill_user_username, bill_year, bill_month,
-            bill_generated_date, bill_serial, bill_no, bill_due_date,
-            bill_start_date, bill_end_date, index_value, energ_cons_cant,
-            energie_consumata, energ_cons_val, energ_cons_tva, acciza_cant,
-            acciza_necomerciala, acciza_val, acciza_tva, certif_cant,
-            certificate_verzi, certif_val, certif_tva, oug_cant, oug_27,
-            oug_val, oug_tva, total_fara_tva, total_tva, total_bill_value))
+        cursor.execute(BILL_INSERT_SQL, tuple(record))
         connection.commit()
+        _invalidate_bill_cache(username, bill_year, bill_month)
         logger.info("Index provided and bill details calculated successfully")
         print(LINE_SEPARATOR)
         print(f"Consumul pentru luna {ro_bill_month} {bill_year} "
@@ -1121,11 +1513,106 @@ def provide_index(
         print(verr)
         raise ValueError from verr
     except sqlite3.Error as sqerr:
-        logger.error("""SQLite error occurred while accessing the database: 
+        logger.error("""SQLite error occurred while accessing the database:
                      %s""", sqerr)
         print(sqerr)
         raise sqlite3.Error from sqerr
 
+def provide_index_bulk(
+        connection: sqlite3.Connection, cursor: sqlite3.Cursor, username: str,
+        entries) -> int:
+    """
+    Inserts consumption index entries for several months in one transaction.
+
+    Intended for backfill tooling built on top of this module: all rows
+    are written inside a single transaction so SQLite syncs to disk once
+    at the end instead of once per month. Each record is built after the
+    previous one is inserted, so the month-over-month consumption is
+    derived from the entry preceding it in the batch.
+
+    Args:
+        connection (sqlite3.Connection): The SQLite database connection.
+        cursor (sqlite3.Cursor): The SQLite cursor.
+        username (str): The username associated with the index values.
+        entries: An iterable of (bill_year, bill_month, index_value) tuples
+            in chronological order.
+
+    Returns:
+        int: The number of bill rows inserted.
+
+    Raises:
+        ValueError: If any entry contains invalid data.
+        sqlite3.Error: If there is an error when executing the SQL statement.
+    """
+    logger.info("Providing %s index entries in bulk for user: %s",
+                len(entries) if hasattr(entries, "__len__") else "multiple",
+                username)
+    try:
+        inserted = 0
+        for bill_year, bill_month, index_value in entries:
+            record = build_bill_record(
+                cursor, username, bill_year, bill_month, index_value)
+            cursor.execute(BILL_INSERT_SQL, tuple(record))
+            inserted += 1
+        connection.commit()
+        _invalidate_bill_cache(username)
+        logger.info("Bulk insert committed: %s bills for user %s",
+                    inserted, username)
+        return inserted
+    except (ValueError, sqlite3.Error) as err:
+        connection.rollback()
+        logger.exception(
+            "Error occurred during bulk index insert: %s", err)
+        raise err
+
+def bulk_insert_bills(
+        connection: sqlite3.Connection, cursor: sqlite3.Cursor,
+        records) -> int:
+    """
+    Inserts prebuilt bill rows using multi-row VALUES statements.
+
+    Unlike provide_index_bulk, which derives each month's consumption
+    from the row inserted before it, this helper takes fully computed
+    BillRecord rows (e.g. from a historical data load) and packs as many
+    rows as fit under SQLite's bound-parameter limit into each INSERT,
+    all inside a single transaction.
+
+    Args:
+        connection (sqlite3.Connection): The SQLite database connection.
+        cursor (sqlite3.Cursor): The SQLite cursor.
+        records: An iterable of BillRecord rows to insert.
+
+    Returns:
+        int: The number of bill rows inserted.
+
+    Raises:
+        sqlite3.Error: If there is an error when executing the SQL statement.
+    """
+    records = list(records)
+    n_cols = len(BillRecord._fields)
+    # stay under the default SQLITE_LIMIT_VARIABLE_NUMBER of 999
+    rows_per_statement = 999 // n_cols
+    row_placeholder = "(" + ", ".join("?" * n_cols) + ")"
+    column_list = ", ".join(BillRecord._fields)
+    logger.info("Bulk inserting %s bill rows", len(records))
+    try:
+        for start in range(0, len(records), rows_per_statement):
+            chunk = records[start:start + rows_per_statement]
+            placeholders = ", ".join([row_placeholder] * len(chunk))
+            cursor.execute(
+                f"INSERT INTO bills ({column_list}) VALUES {placeholders}",
+                list(itertools.chain.from_iterable(chunk)))
+        connection.commit()
+        for record in records:
+            _invalidate_bill_cache(record.username)
+        logger.info("Bulk insert committed: %s bill rows", len(records))
+        return len(records)
+    except sqlite3.Error as sqerr:
+        connection.rollback()
+        logger.exception(
+            "SQLite error occurred during bulk bill insert: %s", sqerr)
+        raise sqerr
+
 def generate_excel_input(cursor: sqlite3.Cursor, username: str) -> int:
     """
     Prompts the user to enter the bill year for generating an Excel export.
@@ -1142,16 +1629,18 @@ def generate_excel_input(cursor: sqlite3.Cursor, username: str) -> int:
     """
     logger.info("Generating Excel input for user: %s", username)
     try:
-        cursor.execute("""SELECT bill_year FROM bills
+        cursor.execute("""SELECT DISTINCT bill_year FROM bills
                        WHERE username = ?
-                       ORDER BY bill_id ASC""", (username,))
-        row = cursor.fetchall()
-        if not row:
+                       ORDER BY bill_year ASC""", (username,))
+        export_years_set = {year for (year,) in cursor.fetchall()}
+        if not export_years_set:
             raise ValueError(
                 "Nu există facturi înregistrate în baza de date!")
-        if len(row) > 1:
-            export_years_set = {tuplu[0] for tuplu in row}
-            export_years = ", ".join(str(year) for year in export_years_set)
+        export_years = ", ".join(str(year) for year in export_years_set)
+        if len(export_years_set) == 1:
+            print(f"Poti genera exportul xlsx pentru anul {export_years}")
+            bill_year = next(iter(export_years_set))
+        else:
             print(f"Poti genera exportul pentru anii: {export_years}")
             while True:
                 try:
@@ -1166,10 +1655,6 @@ def generate_excel_input(cursor: sqlite3.Cursor, username: str) -> int:
                     logger.exception("ValueError occurred: %s", verr)
                     print(LINE_SEPARATOR)
                     print(verr)
-        else:
-            export_years = str(next(iter(export_years_set)))
-            print(f"Poti genera exportul xlsx pentru anul {export_years}")
-            bill_year = int(export_years)
         logger.info("Excel input generated successfully")
         return int(bill_year)
     except sqlite3.Error as sqerr:
@@ -1178,6 +1663,21 @@ def generate_excel_input(cursor: sqlite3.Cursor, username: str) -> int:
         print(f"Eroare la conectarea la baza de date: {sqerr}")
         raise sqlite3.Error from sqerr
 
+def open_file(file_path: str):
+    """
+    Opens a file with the default application of the platform.
+
+    Args:
+        file_path (str): The path of the file to open.
+    """
+    logger.info("Opening file: %s", file_path)
+    if sys.platform == "win32":
+        os.startfile(file_path)
+    elif sys.platform == "darwin":
+        subprocess.Popen(["open", file_path])
+    else:
+        subprocess.Popen(["xdg-open", file_path])
+
 def set_excel_name(username: str, bill_year: int, bill_serial: str) -> str:
     """
     Sets the name and path for the Excel export file.
@@ -1197,8 +1697,7 @@ def set_excel_name(username: str, bill_year: int, bill_serial: str) -> str:
     excel_name = f"export_consum_{username}-{bill_year}.xlsx"
     excel_folder = MAIN_FOLDER_ROOT / "Exporturi excel" / bill_serial
     try:
-        if not os.path.exists(excel_folder):
-            os.makedirs(excel_folder)
+        excel_folder.mkdir(parents=True, exist_ok=True)
     except OSError as oserr:
         logger.exception("OSError occurred while creating the folder: %s",
                          str(excel_folder))
@@ -1220,36 +1719,49 @@ def export_excel_table(cursor: sqlite3.Cursor, username: str):
     Raises:
         OSError: If there is an error creating the directory for the file.
     """
+    # openpyxl is only needed on this path; defer it so app startup and
+    # every non-export menu action stay fast.
+    import openpyxl
+
     logger.info("Exporting bill data to Excel for user: %s", username)
     try:
         bill_year = generate_excel_input(cursor, username)
         if isinstance(bill_year, int):
+            bill_serial = get_client_info(username, cursor)["county_abbr"]
             cursor.execute(
                 """SELECT username, bill_year, bill_month, bill_serial,
-                bill_number, index_value, energ_cons_cant, energ_cons_pret,
-                energ_cons_val, energ_cons_tva, acciza_cant, acciza_pret,
-                acciza_val, acciza_tva, certif_cant, certif_pret, certif_val,
-                certif_tva, oug_cant, oug_pret, oug_val, oug_tva,
+                bill_number, index_value, energ_cons_cant,
+                energ_cons_pret, energ_cons_val, energ_cons_tva,
+                acciza_cant, acciza_pret, acciza_val, acciza_tva,
+                certif_cant, certif_pret, certif_val, certif_tva,
+                oug_cant, oug_pret, oug_val, oug_tva,
                 total_fara_tva, total_tva, total_bill_value
-                FROM bills WHERE username = ? AND bill_year = ?
+                FROM bills
+                WHERE username = ? AND bill_year = ?
                 ORDER BY bill_month ASC""", (username, bill_year))
-            rows = cursor.fetchall()
             columns = [desc[0] for desc in cursor.description]
-            data_frame = pd.DataFrame(rows, columns=columns)
-
-            bill_serial = RO_COUNTIES_ABBR[get_client_info(username, cursor)[
-                "county"]]
             excel_name = set_excel_name(username, bill_year, bill_serial)
             try:
-                if not os.path.exists(os.path.dirname(excel_name)):
-                    os.makedirs(os.path.dirname(excel_name))
-                data_frame.to_excel(excel_name, index=False)
-                subprocess.Popen(["start", "", excel_name], shell=True)
-                logger.info("""Excel export for user %s and year %d generated 
+                workbook = openpyxl.Workbook(write_only=True)
+                worksheet = workbook.create_sheet()
+                worksheet.append(columns)
+                cursor.arraysize = 1000
+                for chunk in iter(cursor.fetchmany, []):
+                    for bill_row in chunk:
+                        worksheet.append(tuple(bill_row))
+                workbook.save(excel_name)
+                open_file(excel_name)
+                logger.info("""Excel export for user %s and year %d generated
                             successfully: %s""", username, bill_year, excel_name)
+                cursor.execute(
+                    """SELECT SUM(total_bill_value) FROM bills
+                    WHERE username = ? AND bill_year = ?""",
+                    (username, bill_year))
+                year_total = cursor.fetchone()[0]
                 print(LINE_SEPARATOR)
                 print(
                     f"Exportul pentru anul {bill_year} a fost generat cu succes!")
+                print(f"Total facturat in anul {bill_year}: {year_total:.2f} lei")
             except OSError as oserr:
                 logger.error("""OSError occurred while creating the Excel 
                              file: %s""", str(excel_name))
@@ -6,7 +6,6 @@ The module provides the following functions:
 
     set_pdf_name: Set the PDF file name based on the bill serial and number.
     draw_img: Inserts an image within the canvas.
-    write_text_line: Inserts line of texts in the pdf page.
     generate_table: Inserts a table within the canvas.
     generate_barcode: Inserts a barcode
     generate_pdf_bill: The main function, that uses all the other functions
@@ -20,14 +19,16 @@ Please note that this module requires the following external libraries:
 For more information, refer to the README file.
 """
 
+import io
 import logging
-import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 from reportlab.graphics.barcode import code128
 from reportlab.lib.colors import black, green, lightgrey, white, whitesmoke
 from reportlab.lib.pagesizes import LETTER
 from reportlab.lib.units import cm
+from reportlab.lib.utils import ImageReader
 from reportlab.pdfgen.canvas import Canvas
 from reportlab.platypus import Table, TableStyle
 
@@ -35,7 +36,7 @@ from db_interaction import LINE_SEPARATOR
 
 # setting up logging configurations and handlers
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
+logger.setLevel(logging.ERROR)
 
 log_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
 
@@ -59,6 +60,14 @@ LOCATION_ICON_FILE = "location_icon.png"
 PHONE_ICON_FILE = "phone_icon.png"
 EMAIL_ICON_FILE = "email_icon.png"
 
+# Decoded once at import: the same four images appear on every bill, so
+# re-reading the PNGs per generated PDF would be wasted I/O
+_ICON_READERS = {
+    name: ImageReader(str(ICONS_PATH / name))
+    for name in (COMPANY_LOGO_FILE, LOCATION_ICON_FILE,
+                 PHONE_ICON_FILE, EMAIL_ICON_FILE)
+}
+
 # Dictionary that stores information about the electrical company
 COMPANY_INFO = {
     "name": "Greenergy",
@@ -69,6 +78,46 @@ COMPANY_INFO = {
     "email": "contact@greenergy.ro"
 }
 
+# Text lines that are identical on every bill, resolved to absolute page
+# coordinates at import so the per-bill loop does no fraction-to-point math:
+# (text, font, size, color, x, y)
+_STATIC_LABELS = (
+    (COMPANY_INFO["name"], "Times-Roman", 25, "green",
+     0.143 * P_WIDTH, 0.926 * P_HEIGHT),
+    (COMPANY_INFO["street"], "Times-Roman", 12, "black",
+     0.143 * P_WIDTH, 0.877 * P_HEIGHT),
+    (COMPANY_INFO["city"], "Times-Roman", 12, "black",
+     0.143 * P_WIDTH, 0.862 * P_HEIGHT),
+    (COMPANY_INFO["country"], "Times-Roman", 12, "black",
+     0.143 * P_WIDTH, 0.847 * P_HEIGHT),
+    (COMPANY_INFO["phone"], "Times-Roman", 12, "black",
+     0.143 * P_WIDTH, 0.826 * P_HEIGHT),
+    (COMPANY_INFO["email"], "Times-Roman", 12, "black",
+     0.143 * P_WIDTH, 0.806 * P_HEIGHT),
+    ("Factura fiscala", "Times-Bold", 13, "black",
+     0.625 * P_WIDTH, 0.741 * P_HEIGHT),
+    ("Data facturii:", "Times-Bold", 12, "black",
+     0.625 * P_WIDTH, 0.699 * P_HEIGHT),
+    ("Data scadenta:", "Times-Bold", 12, "black",
+     0.625 * P_WIDTH, 0.680 * P_HEIGHT),
+    ("Perioada de facturare:", "Times-Bold", 12, "black",
+     0.625 * P_WIDTH, 0.662 * P_HEIGHT),
+    ("Detalii factura curenta:", "Times-Bold", 24, "green",
+     0.111 * P_WIDTH, 0.588 * P_HEIGHT),
+    ("Din ce este compus consumul tau?", "Times-Bold", 15, "green",
+     0.111 * P_WIDTH, 0.500 * P_HEIGHT),
+    (f"{COMPANY_INFO['name'].upper()} HOME ELECTRIC", "Times-Bold", 14,
+     "black", 0.111 * P_WIDTH, 0.556 * P_HEIGHT),
+    ("Total", "Times-Bold", 10, "black",
+     0.15 * P_WIDTH, 0.204 * P_HEIGHT),
+    ("Total de plata, TVA inclus [Lei]", "Times-Roman", 12, "black",
+     0.11 * P_WIDTH, 0.164 * P_HEIGHT),
+    ("Cod de bare pentru factura curenta", "Times-Bold", 9, "black",
+     0.165 * P_WIDTH, 0.05 * P_HEIGHT),
+    ("Cod de bare pentru total de plata (sold)", "Times-Bold", 9, "black",
+     0.6 * P_WIDTH, 0.05 * P_HEIGHT),
+)
+
 def set_pdf_name(bill_serial: str, bill_number: str):
     """
     Set the PDF file name based on the bill serial and number.
@@ -88,9 +137,7 @@ def set_pdf_name(bill_serial: str, bill_number: str):
                 f"_{bill_serial}-{bill_number}.pdf")
     pdf_bills_folder = MAIN_FOLDER_ROOT / "Facturi generate" / bill_serial
     try:
-        if not os.path.exists(pdf_bills_folder):
-            os.makedirs(pdf_bills_folder)
-            logger.info("PDF bills folder created: %s", str(pdf_bills_folder))
+        pdf_bills_folder.mkdir(parents=True, exist_ok=True)
     except OSError as oserr:
         logger.error("OSError occurred while creating the PDF bills folder: %s",
                      str(pdf_bills_folder))
@@ -100,14 +147,15 @@ def set_pdf_name(bill_serial: str, bill_number: str):
     return str(pdf_bills_folder / pdf_name)
 
 def draw_img(
-        canvas: Canvas, file_path: str, x_origin: float, y_origin: float,
+        canvas: Canvas, image: ImageReader, x_origin: float, y_origin: float,
         img_width: float, img_height: float):
     """
     Inserts an image within a canvas.
 
     Args:
         canvas (Canvas): The canvas where the image will be inserted.
-        file_path (str): The path to the image file that will be inserted.
+        image (ImageReader): The decoded image to insert; the bill icons
+            are cached in _ICON_READERS so they are read from disk once.
         x_origin (float): The x-coord. from bottom-left corner of the image.
         y_origin (float): The y-coord. from bottom-left corner of the image.
         img_width (float): The width of the image.
@@ -119,45 +167,15 @@ def draw_img(
         TypeError: If any of the arguments is not of expected type.
         Exception: If any other unexpected error occurs during the execution.
     """
-    logger.info("Inserting image: %s", file_path)
+    logger.info("Inserting image: %s", image)
     if (not 0 <= x_origin <= 1 or not 0 <= y_origin <= 1
             or not 0 <= img_width <= 1 or not 0 <= img_height <= 1):
         raise ValueError(
             "Pozitia/dimensiunea trebuie sa fie de tip float (0-1).")
-    canvas.drawImage(file_path, x_origin * P_WIDTH, y_origin * P_HEIGHT,
+    canvas.drawImage(image, x_origin * P_WIDTH, y_origin * P_HEIGHT,
                      img_width * P_WIDTH, img_height * P_HEIGHT, "auto")
     logger.info("Image inserted successfully.")
 
-def write_text_line(
-        canvas: Canvas, text: str, font: str, size: int, text_color: str,
-        x_value: float, y_value: float):
-    """
-    Writes a single line of text on the given canvas at specified coordinates.
-
-    Args:
-        canvas (Canvas): The canvas object on which to write the text.
-        text (str): The text to be written.
-        font (str): The font to be used for the text, e.g. "Times-Roman".
-        size (int): The font size of the text, float accepted, e.g. "10".
-        text_color (str): The color of the text (needs to be imported)
-        x_value (float): The x-coordinate of the starting position of the text.
-        y_value (float): The y-coordinate of the baseline position of the text.
-    Raises:
-        ValueError: If any of the float arguments (x, y) have invalid values.
-        AttributeError: If the specified argument for text is not string.
-        TypeError: If any of the arguments is not of expected type.
-        KeyError: If the specified font does not exist in the library.
-        Exception: If any other unexpected error occurs during the execution.
-    """
-    logger.info("Writing text: %s", text)
-    if not 0 <= x_value <= 1 or not 0 <= y_value <= 1:
-        raise ValueError(
-            "Pozitia/dimensiunea trebuie sa fie de tip float (0-1).")
-    canvas.setFont(font, size)
-    canvas.setFillColor(text_color)
-    canvas.drawString(x_value * P_WIDTH, y_value * P_HEIGHT, text)
-    logger.info("Text written successfully.")
-
 def generate_table(canvas: Canvas, content: dict):
     """
     Generates a table on a canvas based on the provided content.
@@ -203,40 +221,34 @@ def generate_table(canvas: Canvas, content: dict):
     logger.info("Table generated successfully.")
 
 def generate_barcode(
-        canvas: Canvas, barcode_value: str, x_position: float,
+        canvas: Canvas, barcode_value: str, x_positions: tuple,
         y_position: float):
     """
-    Generates a barcode on a canvas at the specified position.
+    Generates a barcode on a canvas at the specified positions.
+
+    The Code128 widget is encoded once and stamped at every requested
+    x position, so repeating the same value costs one layout.
 
     Args:
         canvas: The canvas object on which to draw the barcode.
         barcode_value (str): The value of the barcode to be generated.
-        canvas_object (Canvas): The canvas object on which to draw the barcode.
-        x (float): The factor for adjusting the x position of the barcode.
+        x_positions (tuple): The factors adjusting each x position where
+            the barcode is drawn.
+        y_position (float): The factor for the y position of the barcode.
 
     Raises:
         TypeError: If the arguments are not of expected type.
         ValueError: If any of the float arguments have invalid values.
     """
     logger.info("Generating barcode.")
-    try:
-        if not isinstance(canvas, Canvas):
-            raise TypeError(
-                "Parametrul 'canvas' trebuie sa fie de tipul Canvas.")
-        canvas.setFillColor("black")
-        bill_barcode = code128.Code128(
-            barcode_value, barWidth=1, barHeight=1 * cm, humanReadable=True)
-        bill_barcode.drawOn(canvas, (P_WIDTH - bill_barcode.width) / x_position,
+    canvas.setFillColor("black")
+    bill_barcode = code128.Code128(
+        barcode_value, barWidth=1, barHeight=1 * cm, humanReadable=True)
+    for x_position in x_positions:
+        bill_barcode.drawOn(canvas,
+                            (P_WIDTH - bill_barcode.width) / x_position,
                             y_position * P_HEIGHT)
-        logger.info("Barcode generated successfully.")
-    except TypeError as terr:
-        logger.error("TypeError occurred: %s", terr)
-        print(f"Eroare: {terr}")
-        raise terr
-    except ValueError as verr:
-        logger.error("ValueError occurred: %s", str(verr))
-        print(f"Eroare: {verr}")
-        raise verr
+    logger.info("Barcode generated successfully.")
 
 def generate_pdf_bill(
         file_name: str, client_info: dict, bill_info: dict, bill_details: dict):
@@ -254,17 +266,19 @@ def generate_pdf_bill(
         ValueError: If the float argument has invalid value.
     """
     try:
-        # Create a canvas object with the given file_name and pagesize
-        bill_canvas = Canvas(file_name, pagesize=PAGE_SIZE)
+        # Render into memory and write the file in one go at the end,
+        # instead of letting the canvas issue many small writes
+        pdf_buffer = io.BytesIO()
+        bill_canvas = Canvas(pdf_buffer, pagesize=PAGE_SIZE)
 
         # Insert the logo and different icons in the canvas
-        draw_img(bill_canvas, ICONS_PATH / COMPANY_LOGO_FILE,
+        draw_img(bill_canvas, _ICON_READERS[COMPANY_LOGO_FILE],
                  0.645, 0.8, 0.159, 0.143)
-        draw_img(bill_canvas, ICONS_PATH / LOCATION_ICON_FILE,
+        draw_img(bill_canvas, _ICON_READERS[LOCATION_ICON_FILE],
                  0.111, 0.862, 0.011, 0.014)
-        draw_img(bill_canvas, ICONS_PATH / PHONE_ICON_FILE,
+        draw_img(bill_canvas, _ICON_READERS[PHONE_ICON_FILE],
                  0.111, 0.826, 0.011, 0.013)
-        draw_img(bill_canvas, ICONS_PATH / EMAIL_ICON_FILE,
+        draw_img(bill_canvas, _ICON_READERS[EMAIL_ICON_FILE],
                  0.111, 0.806, 0.014, 0.007)
 
         # Insert horizontal lines/rectangle to visually separate the content
@@ -277,97 +291,73 @@ def generate_pdf_bill(
         bill_canvas.rect(0.1 * P_WIDTH, 0.154 * P_HEIGHT, 0.8 * P_WIDTH,
                          0.028 * P_HEIGHT, fill=1)
 
-        # Insert the information text about the company
-        write_text_line(bill_canvas, COMPANY_INFO["name"], "Times-Roman",
-                        25, "green", 0.143, 0.926)
-        write_text_line(bill_canvas, COMPANY_INFO["street"], "Times-Roman",
-                        12, "black", 0.143, 0.877)
-        write_text_line(bill_canvas, COMPANY_INFO["city"], "Times-Roman",
-                        12, "black", 0.143, 0.862)
-        write_text_line(bill_canvas, COMPANY_INFO["country"], "Times-Roman",
-                        12, "black", 0.143, 0.847)
-        write_text_line(bill_canvas, COMPANY_INFO["phone"], "Times-Roman",
-                        12, "black", 0.143, 0.826)
-        write_text_line(bill_canvas, COMPANY_INFO["email"], "Times-Roman",
-                        12, "black", 0.143, 0.806)
-
-        # Insert the information about the current bill
-        write_text_line(bill_canvas, "Factura fiscala", "Times-Bold", 13,
-                        "black", 0.625, 0.741)
-        write_text_line(bill_canvas,
-                        f"Seria {bill_info['bill_serial']} nr. "
-                        f"{bill_info['bill_number']}",
-                        "Times-Roman", 12, "black", 0.625, 0.719)
-        write_text_line(bill_canvas, bill_info['bill_generated_date'],
-                        "Times-Roman", 12, "black", 0.746, 0.699)
-        write_text_line(bill_canvas, bill_info['bill_due_date'], "Times-Roman",
-                        12, "black", 0.758, 0.680)
-        write_text_line(bill_canvas,
-                        f"{bill_info['bill_start_date']} - "
-                        f"{bill_info['bill_end_date']}",
-                        "Times-Roman", 12, "black", 0.625, 0.643)
-        write_text_line(bill_canvas, "Data facturii:", "Times-Bold", 12,
-                        "black", 0.625, 0.699)
-        write_text_line(bill_canvas, "Data scadenta:", "Times-Bold", 12,
-                        "black", 0.625, 0.680)
-        write_text_line(bill_canvas, "Perioada de facturare:", "Times-Bold",
-                        12, "black", 0.625, 0.662)
-
-        # Insert the information about the client
-        write_text_line(bill_canvas, client_info["name"].upper(), "Times-Bold",
-                        13, "black", 0.143, 0.741)
-        write_text_line(bill_canvas, client_info["street"], "Times-Roman", 12,
-                        "black", 0.143, 0.719)
-        write_text_line(bill_canvas,
-                        f"{client_info['zipcode']}, {client_info['city'].upper()}, "
-                        f"Judetul {client_info['county']}",
-                        "Times-Roman", 12, "black", 0.143, 0.699)
-        write_text_line(bill_canvas, f"Cod client: {client_info['id']}",
-                        "Times-Roman", 12, "black", 0.143, 0.680)
-
-        # Insert the information about the bill value
-        write_text_line(bill_canvas, "Detalii factura curenta:", "Times-Bold",
-                        24, "green", 0.111, 0.588)
-        write_text_line(bill_canvas, "Din ce este compus consumul tau?",
-                        "Times-Bold", 15, "green", 0.111, 0.500)
-        write_text_line(bill_canvas,
-                        f"{COMPANY_INFO['name'].upper()} HOME ELECTRIC",
-                        "Times-Bold", 14, "black", 0.111, 0.556)
-        write_text_line(bill_canvas, f"{bill_info['total_bill_value']:.2f}  lei",
-                        "Times-Bold", 14, "black", 0.769, 0.556)
-        write_text_line(bill_canvas, "Total", "Times-Bold",
-                        10, "black", 0.15, 0.204)
-        write_text_line(bill_canvas, f"{bill_info['total_fara_tva']:.2f}",
-                        "Times-Bold", 10, "black", 0.657, 0.204)
-        write_text_line(bill_canvas, f"{bill_info['total_tva']:.2f}",
-                        "Times-Bold", 10, "black", 0.813, 0.204)
-        write_text_line(bill_canvas, "Total de plata, TVA inclus [Lei]",
-                        "Times-Roman", 12, "black", 0.11, 0.164)
-        write_text_line(bill_canvas, f"{bill_info['total_bill_value']:.2f}",
-                        "Times-Roman", 12, "black", 0.808, 0.164)
-
-        # Insert the text under the barcodes
-        write_text_line(bill_canvas, "Cod de bare pentru factura curenta",
-                        "Times-Bold", 9, "black", 0.165, 0.05)
-        write_text_line(bill_canvas, "Cod de bare pentru total de plata (sold)",
-                        "Times-Bold", 9, "black", 0.6, 0.05)
+        # Collect every text line - the static labels plus the values read
+        # from the bill and client dictionaries - and draw them in one pass
+        text_lines = list(_STATIC_LABELS)
+        text_lines += (
+            # the information about the current bill
+            (f"Seria {bill_info['bill_serial']} nr. "
+             f"{bill_info['bill_number']}",
+             "Times-Roman", 12, "black",
+             0.625 * P_WIDTH, 0.719 * P_HEIGHT),
+            (bill_info['bill_generated_date'], "Times-Roman", 12, "black",
+             0.746 * P_WIDTH, 0.699 * P_HEIGHT),
+            (bill_info['bill_due_date'], "Times-Roman", 12, "black",
+             0.758 * P_WIDTH, 0.680 * P_HEIGHT),
+            (f"{bill_info['bill_start_date']} - "
+             f"{bill_info['bill_end_date']}",
+             "Times-Roman", 12, "black",
+             0.625 * P_WIDTH, 0.643 * P_HEIGHT),
+            # the information about the client
+            (client_info["name"].upper(), "Times-Bold", 13, "black",
+             0.143 * P_WIDTH, 0.741 * P_HEIGHT),
+            (client_info["street"], "Times-Roman", 12, "black",
+             0.143 * P_WIDTH, 0.719 * P_HEIGHT),
+            (f"{client_info['zipcode']}, {client_info['city'].upper()}, "
+             f"Judetul {client_info['county']}",
+             "Times-Roman", 12, "black",
+             0.143 * P_WIDTH, 0.699 * P_HEIGHT),
+            (f"Cod client: {client_info['id']}", "Times-Roman", 12, "black",
+             0.143 * P_WIDTH, 0.680 * P_HEIGHT),
+            # the information about the bill value
+            (f"{bill_info['total_bill_value']:.2f}  lei", "Times-Bold", 14,
+             "black", 0.769 * P_WIDTH, 0.556 * P_HEIGHT),
+            (f"{bill_info['total_fara_tva']:.2f}", "Times-Bold", 10, "black",
+             0.657 * P_WIDTH, 0.204 * P_HEIGHT),
+            (f"{bill_info['total_tva']:.2f}", "Times-Bold", 10, "black",
+             0.813 * P_WIDTH, 0.204 * P_HEIGHT),
+            (f"{bill_info['total_bill_value']:.2f}", "Times-Roman", 12,
+             "black", 0.808 * P_WIDTH, 0.164 * P_HEIGHT),
+        )
+        # Sort the lines by text state so setFont/setFillColor run once per
+        # (font, size, color) group, and emit everything through a single
+        # text object - one BT..ET block instead of one per line
+        text_lines.sort(key=lambda line: (line[1], line[2], line[3]))
+        text_object = bill_canvas.beginText()
+        current_state = None
+        for text, font, size, color, x_value, y_value in text_lines:
+            if (font, size, color) != current_state:
+                text_object.setFont(font, size)
+                text_object.setFillColor(color)
+                current_state = (font, size, color)
+            text_object.setTextOrigin(x_value, y_value)
+            text_object.textOut(text)
+        bill_canvas.drawText(text_object)
 
         # Insert the table containing the details about consumption and prices
         generate_table(bill_canvas, bill_details)
 
-        # Create strings for barcode generation
-        current_bill_barcode = (
-            f"{bill_info['bill_number']}{bill_info['total_bill_value']:.2f}")
-        total_value_barcode = (
+        # Both barcodes carry the same bill number and total, so the value
+        # is encoded once and drawn at both positions
+        bill_barcode_value = (
             f"{bill_info['bill_number']}{bill_info['total_bill_value']:.2f}")
-
-        # Insert the barcodes in image format in the canvas
-        generate_barcode(bill_canvas, current_bill_barcode, 6, 0.085)
-        generate_barcode(bill_canvas, total_value_barcode, 1.2, 0.085)
+        generate_barcode(bill_canvas, bill_barcode_value, (6, 1.2), 0.085)
 
         # Save the modifications for the pdf export
         bill_canvas.showPage()
         bill_canvas.save()
+        with open(file_name, "wb") as pdf_file:
+            pdf_file.write(pdf_buffer.getbuffer())
         print("-" * 65)
         print("Factura a fost generata cu succes!")
     except AttributeError as aerr:
@@ -390,3 +380,28 @@ def generate_pdf_bill(
         logger.exception(oserr)
         print(LINE_SEPARATOR)
         print(oserr)
+
+def generate_pdf_bills_bulk(jobs) -> int:
+    """
+    Generates many PDF bills in parallel worker processes.
+
+    Each bill is independent and reportlab's layout work is pure Python,
+    so threads gain nothing under the GIL; separate processes scale with
+    the core count. Workers import this module on start, which also
+    initializes their own _ICON_READERS cache.
+
+    Args:
+        jobs: An iterable of (file_name, client_info, bill_info,
+            bill_details) tuples, one per bill.
+
+    Returns:
+        int: The number of bills generated.
+    """
+    jobs = list(jobs)
+    logger.info("Generating %s PDF bills in parallel", len(jobs))
+    with ProcessPoolExecutor() as executor:
+        pending = [executor.submit(generate_pdf_bill, *job) for job in jobs]
+        for job_future in pending:
+            job_future.result()
+    logger.info("Bulk PDF generation finished: %s bills", len(jobs))
+    return len(jobs)
@@ -19,7 +19,6 @@ For more information, refer to the README file.
 
 import logging
 import sqlite3
-import subprocess
 import sys
 from pathlib import Path
 
@@ -27,13 +26,14 @@ from db_interaction import (LINE_SEPARATOR, add_new_user, authenticate,
                             create_consumption_table, delete_user,
                             export_excel_table, generate_bill_input,
                             get_bill_info, get_client_info, get_index_input,
-                            modify_user_address, provide_index, update_index)
+                            modify_user_address, open_database, open_file,
+                            provide_index, update_index)
 from exceptions import AuthenticationError
 from generate_pdf import generate_pdf_bill, set_pdf_name
 
 # setting up logging configurations and handlers
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
+logger.setLevel(logging.ERROR)
 
 log_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
 
@@ -57,7 +57,7 @@ class MenuHandler:
     """
 
     def __init__(self):
-        self.connection = sqlite3.connect(DB_FILE)
+        self.connection = open_database(DB_FILE)
         self.cursor = self.connection.cursor()
         self.username = ""
         self.is_admin = False
@@ -217,7 +217,7 @@ class MenuHandler:
             logger.info("Generating PDF bill")
             generate_pdf_bill(file_name, client_info, bill_info, bill_details)
             logger.info("Opening PDF bill")
-            subprocess.Popen(["start", "", file_name], shell=True)
+            open_file(file_name)
         except OSError as oserr:
             logger.exception("OSError occurred: %s", oserr)
             print(LINE_SEPARATOR)